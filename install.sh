@@ -397,6 +397,11 @@ if [[ "$SETUP_MODE" == true ]]; then
     echo "Installing dependencies into .venv..."
     "$VENV_PYTHON" -m pip install --upgrade pip >/dev/null
     "$VENV_PYTHON" -m pip install -r "$SCRIPT_DIR/requirements.txt"
+
+    # The service runs with -OO, which loads .opt-2.pyc files; build them now
+    # so the first start after boot does not have to compile dependencies.
+    echo "Precompiling .venv bytecode..."
+    "$VENV_PYTHON" -OO -m compileall -q "$VENV_DIR" >/dev/null || true
 fi
 
 SERVICE_PYTHON="$SYSTEM_PYTHON"
@@ -446,6 +451,7 @@ cat > "$PLIST_PATH" << PLIST
     <key>ProgramArguments</key>
     <array>
         <string>$SERVICE_PYTHON</string>
+        <string>-OO</string>
         <string>$SCRIPT_DIR/plex-lights.py</string>
     </array>
     <key>WorkingDirectory</key>
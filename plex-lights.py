@@ -14,24 +14,57 @@ Configuration via config.json or environment variables.
 """
 
 import argparse
-import copy
+import atexit
+import functools
+import importlib.util
+import itertools
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import signal
 import sys
+import tempfile
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, unquote_plus
 
-try:
-    import requests
-except ImportError:
-    print("ERROR: requests not installed. Run: pip install -r requirements.txt")
-    sys.exit(1)
+# requests (and urllib3, certifi, ...) is the slowest import here, so it is
+# loaded on the first provider call via load_requests(); main() only checks
+# that it is installed.
+requests = None
 
 REQUEST_TIMEOUT_SECONDS = 10
+# Connects are retried (see create_http_session), so an unreachable host must
+# fail fast: a short connect timeout keeps three attempts to a few seconds.
+CONNECT_TIMEOUT_SECONDS = 3
+REQUEST_TIMEOUT = (CONNECT_TIMEOUT_SECONDS, REQUEST_TIMEOUT_SECONDS)
+EVENT_DEBOUNCE_SECONDS = 0.15
+MAX_BODY_BYTES = 64 * 1024
+MAX_FORM_FIELDS = 32
+ERROR_BODY_LOG_BYTES = 512
+HANDLER_TIMEOUT_SECONDS = 5
+TOKEN_HEADER = "X-Plex-Lights-Token"
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+HUE_MAX_CONNECTIONS = 4
+IO_MAX_WORKERS = 8
+HTTP_MAX_WORKERS = 8
+PROVIDER_COUNT = 3
+GOVEE_API_BASE_URL = "https://openapi.api.govee.com"
+GOVEE_CONTROL_URL = f"{GOVEE_API_BASE_URL}/router/api/v1/device/control"
+GOVEE_STATE_URL = f"{GOVEE_API_BASE_URL}/router/api/v1/device/state"
+CONFIG_CACHE_VERSION = 2
+SCRIPT_PATH = Path(__file__)
+CONFIG_PATH = SCRIPT_PATH.parent / "config.json"
+CONFIG_CACHE_SUFFIX = ".validated"
+TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
+FALSE_STRINGS = frozenset({"0", "false", "no", "off", ""})
 SUPPORTED_MEDIA_TYPES = {"movie", "episode", ""}
 EVENT_TO_MODE = {
     "play": "movie",
@@ -39,6 +72,16 @@ EVENT_TO_MODE = {
     "pause": "pause",
     "stop": "normal",
 }
+EVENT_ALIASES = {
+    alias: canonical
+    for canonical, aliases in {
+        "play": ("play", "playback start", "playback.start", "played"),
+        "resume": ("resume", "playback resume", "playback.resume", "resumed"),
+        "pause": ("pause", "playback pause", "playback.pause", "paused"),
+        "stop": ("stop", "ended", "playback stop", "playback.stop", "playback ended", "stopped"),
+    }.items()
+    for alias in aliases
+}
 
 # --- Config ---
 
@@ -48,17 +91,20 @@ DEFAULT_CONFIG = {
     "tv_player_name": "",
     "webhook_token": "",
     "dry_run": False,
+    "force_apply": False,
     "hue": {
         "enabled": False,
         "bridge_ip": "",
         "api_user": "",
         "lights": [],
+        "group_id": "",
     },
     "govee": {
         "enabled": False,
         "api_key": "",
         "device": "",
         "model": "",
+        "brightness_in_color": False,
     },
     "home_assistant": {
         "enabled": False,
@@ -110,22 +156,57 @@ DEFAULT_CONFIG = {
     },
 }
 
+# load_config starts from a fresh copy of the defaults; decoding this is much
+# cheaper than deepcopy for a tree of plain JSON values.
+DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
+
+class RuntimeState:
+    """Playback state shared between events; guard every access with RUNTIME_LOCK."""
+
+    __slots__ = ("playback_active", "snapshot", "applied_modes")
+
+    def __init__(self):
+        self.playback_active = False
+        self.snapshot = None
+        # Provider name ("hue", "govee", "home_assistant") -> mode it last applied.
+        self.applied_modes = {}
+
+
 RUNTIME_LOCK = threading.Lock()
-RUNTIME_STATE = {
-    "playback_active": False,
-    "snapshot": None,
-}
+HTTP_SESSION_LOCK = threading.Lock()
+RUNTIME_STATE = RuntimeState()
+
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="plex-lights-io")
+# Provider setters wait on IO_EXECUTOR work, so they run on their own pool to
+# avoid ever filling IO_EXECUTOR with tasks that block on it.
+PROVIDER_EXECUTOR = ThreadPoolExecutor(max_workers=PROVIDER_COUNT, thread_name_prefix="plex-lights-provider")
+
+# Govee only needs unique request IDs; a counter avoids clock reads and the
+# duplicate IDs that concurrent requests in the same millisecond would get.
+GOVEE_REQUEST_IDS = itertools.count(int(time.time() * 1000))
+
+# Webhooks are acknowledged immediately and applied in order by one worker.
+PENDING_EVENTS = deque()
+PENDING_EVENTS_CONDITION = threading.Condition()
 
 
 def deep_merge(base, override):
-    """Recursively merge override into base dict."""
-    result = dict(base)
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    """Merge override into base dict in place and return base.
+
+    Callers must own base (e.g. a fresh copy of DEFAULT_CONFIG); nested dicts
+    are merged with an explicit stack instead of recursion.
+    """
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return base
 
 
 def parse_hue_lights(lights_str):
@@ -166,19 +247,33 @@ def parse_mode_scenes(mapping_str):
     return mode_scenes
 
 
-def as_bool(value):
-    """Parse booleans from native bools or common string representations."""
-    if isinstance(value, bool):
+def as_bool(value, unknown=None):
+    """Parse booleans from native bools, numbers, or common string representations.
+
+    Unrecognized strings are truthy when non-empty, unless ``unknown`` is given,
+    in which case it is returned instead (API payloads use unknown=False).
+    """
+    if value is True or value is False:
         return value
-    if isinstance(value, str):
+    if type(value) is str:
         normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes", "on"}:
+        if normalized in TRUE_STRINGS:
             return True
-        if normalized in {"0", "false", "no", "off", ""}:
+        if normalized in FALSE_STRINGS:
             return False
+        if unknown is not None:
+            return unknown
     return bool(value)
 
 
+def norm_str(mapping, key, default=""):
+    """Return mapping[key] as a stripped string, skipping str() for values that already are."""
+    value = mapping.get(key, default)
+    if type(value) is str:
+        return value.strip()
+    return str(value).strip()
+
+
 def validate_rgb_list(mode, errors, mode_name, field_name):
     """Validate RGB list. Empty list is treated as disabled."""
     rgb = mode.get(field_name)
@@ -222,30 +317,39 @@ def validate_int_range(config, errors, field_name, min_value, max_value):
 
 
 def validate_modes(config, errors):
-    """Validate required mode keys and numeric ranges."""
+    """Validate required mode keys and numeric ranges for enabled providers."""
     modes = config.get("modes")
     if not isinstance(modes, dict):
         errors.append("modes must be an object")
         return
 
+    hue_enabled = config["hue"]["enabled"]
+    govee_enabled = config["govee"]["enabled"]
+    home_assistant_enabled = config["home_assistant"]["enabled"]
+
     for mode_name in ("movie", "pause", "normal"):
         mode = modes.get(mode_name)
         if not isinstance(mode, dict):
             errors.append(f"modes.{mode_name} is missing or invalid")
             continue
 
-        validate_int_range(mode, errors, "hue_brightness", 1, 254)
-        validate_int_range(mode, errors, "hue_color_temp", 153, 500)
-        validate_int_range(mode, errors, "govee_brightness", 0, 100)
-        validate_int_range(mode, errors, "ha_brightness_pct", 0, 100)
-        validate_int_range(mode, errors, "ha_color_temp_kelvin", 1500, 9000)
-        validate_rgb_list(mode, errors, mode_name, "ha_rgb_color")
+        if hue_enabled:
+            validate_int_range(mode, errors, "hue_brightness", 1, 254)
+            validate_int_range(mode, errors, "hue_color_temp", 153, 500)
+        if home_assistant_enabled:
+            validate_int_range(mode, errors, "ha_brightness_pct", 0, 100)
+            validate_int_range(mode, errors, "ha_color_temp_kelvin", 1500, 9000)
+            validate_rgb_list(mode, errors, mode_name, "ha_rgb_color")
+        if not govee_enabled:
+            continue
 
+        validate_int_range(mode, errors, "govee_brightness", 0, 100)
         color = mode.get("govee_color")
         if not isinstance(color, dict):
             errors.append(f"modes.{mode_name}.govee_color must be an object")
             continue
 
+        valid_channels = 0
         for channel in ("r", "g", "b"):
             try:
                 color_value = int(color.get(channel))
@@ -258,6 +362,10 @@ def validate_modes(config, errors):
                 continue
 
             color[channel] = color_value
+            valid_channels += 1
+
+        if valid_channels == 3:
+            mode["_govee_color_value"] = pack_govee_color(color)
 
 
 def validate_config(config):
@@ -266,9 +374,10 @@ def validate_config(config):
 
     validate_int_range(config, errors, "port", 1, 65535)
 
-    config["tv_player_name"] = str(config.get("tv_player_name", "")).strip()
-    config["webhook_token"] = str(config.get("webhook_token", "")).strip()
+    config["tv_player_name"] = norm_str(config, "tv_player_name")
+    config["webhook_token"] = norm_str(config, "webhook_token")
     config["dry_run"] = as_bool(config.get("dry_run", False))
+    config["force_apply"] = as_bool(config.get("force_apply", False))
 
     hue = config.get("hue")
     if not isinstance(hue, dict):
@@ -277,9 +386,9 @@ def validate_config(config):
         config["hue"] = hue
     hue["enabled"] = as_bool(hue.get("enabled"))
     if hue["enabled"]:
-        if not str(hue.get("bridge_ip", "")).strip():
+        if not norm_str(hue, "bridge_ip"):
             errors.append("hue.bridge_ip is required when hue.enabled=true")
-        if not str(hue.get("api_user", "")).strip():
+        if not norm_str(hue, "api_user"):
             errors.append("hue.api_user is required when hue.enabled=true")
 
         lights = hue.get("lights")
@@ -299,18 +408,24 @@ def validate_config(config):
                 normalized.append(parsed)
             hue["lights"] = normalized
 
+        group_id = norm_str(hue, "group_id")
+        if group_id and not group_id.isdigit():
+            errors.append("hue.group_id must be a non-negative integer or empty")
+        hue["group_id"] = group_id
+
     govee = config.get("govee")
     if not isinstance(govee, dict):
         errors.append("govee must be an object")
         govee = {}
         config["govee"] = govee
     govee["enabled"] = as_bool(govee.get("enabled"))
+    govee["brightness_in_color"] = as_bool(govee.get("brightness_in_color", False))
     if govee["enabled"]:
-        if not str(govee.get("api_key", "")).strip():
+        if not norm_str(govee, "api_key"):
             errors.append("govee.api_key is required when govee.enabled=true")
-        if not str(govee.get("device", "")).strip():
+        if not norm_str(govee, "device"):
             errors.append("govee.device is required when govee.enabled=true")
-        if not str(govee.get("model", "")).strip():
+        if not norm_str(govee, "model"):
             errors.append("govee.model is required when govee.enabled=true")
 
     home_assistant = config.get("home_assistant")
@@ -328,7 +443,7 @@ def validate_config(config):
         mode_scenes = {}
         home_assistant["mode_scenes"] = mode_scenes
     for mode_name in ("movie", "pause", "normal"):
-        mode_scenes[mode_name] = str(mode_scenes.get(mode_name, "")).strip()
+        mode_scenes[mode_name] = norm_str(mode_scenes, mode_name)
 
     entity_ids = home_assistant.get("entity_ids")
     if not isinstance(entity_ids, list):
@@ -336,11 +451,12 @@ def validate_config(config):
         entity_ids = []
         home_assistant["entity_ids"] = entity_ids
     else:
-        home_assistant["entity_ids"] = [str(entity).strip() for entity in entity_ids if str(entity).strip()]
+        stripped = (str(entity).strip() for entity in entity_ids)
+        home_assistant["entity_ids"] = [entity for entity in stripped if entity]
 
     if home_assistant["enabled"]:
-        home_assistant["url"] = str(home_assistant.get("url", "")).strip().rstrip("/")
-        home_assistant["token"] = str(home_assistant.get("token", "")).strip()
+        home_assistant["url"] = norm_str(home_assistant, "url").rstrip("/")
+        home_assistant["token"] = norm_str(home_assistant, "token")
 
         if not home_assistant["url"]:
             errors.append("home_assistant.url is required when home_assistant.enabled=true")
@@ -362,15 +478,17 @@ def validate_config(config):
 
     state_restore["enabled"] = as_bool(state_restore.get("enabled", True))
     state_restore["capture_govee_state"] = as_bool(state_restore.get("capture_govee_state", True))
-    state_restore["home_assistant_scene_id"] = str(
-        state_restore.get("home_assistant_scene_id", "plex_lights_preplay")
-    ).strip()
+    state_restore["home_assistant_scene_id"] = norm_str(
+        state_restore, "home_assistant_scene_id", "plex_lights_preplay"
+    )
     if state_restore["home_assistant_scene_id"].startswith("scene."):
         state_restore["home_assistant_scene_id"] = state_restore["home_assistant_scene_id"][6:]
     if not state_restore["home_assistant_scene_id"]:
         state_restore["home_assistant_scene_id"] = "plex_lights_preplay"
+    # scene.create takes the bare ID; scene.turn_on needs the entity ID.
+    state_restore["_scene_entity_id"] = f"scene.{state_restore['home_assistant_scene_id']}"
 
-    fallback_mode = str(state_restore.get("fallback_mode", "normal")).strip().lower()
+    fallback_mode = norm_str(state_restore, "fallback_mode", "normal").lower()
     if not fallback_mode:
         fallback_mode = "normal"
     state_restore["fallback_mode"] = fallback_mode
@@ -391,28 +509,138 @@ def validate_config(config):
     return config
 
 
+def precompute_mode_payloads(config):
+    """Build per-mode provider payloads once so applying a mode is a lookup."""
+    precomputed = {}
+    for mode_name in ("movie", "pause", "normal"):
+        mode = config["modes"][mode_name]
+        payloads = {}
+        if config["hue"]["enabled"]:
+            payloads["hue"] = {"on": True, "bri": mode["hue_brightness"], "ct": mode["hue_color_temp"]}
+        if config["govee"]["enabled"] and config["govee"]["brightness_in_color"]:
+            # One request: brightness is folded into the color instead of set separately.
+            scaled = scale_govee_color(mode["_govee_color_value"], mode["govee_brightness"])
+            payloads["govee_color_cap"] = govee_color_capability(scaled)
+        elif config["govee"]["enabled"]:
+            payloads["govee_color_cap"] = govee_color_capability(mode["_govee_color_value"])
+            payloads["govee_bri_cap"] = govee_brightness_capability(mode["govee_brightness"])
+        if config["home_assistant"]["enabled"]:
+            service_call = home_assistant_mode_service_call(config["home_assistant"], mode_name, mode)
+            if service_call is not None:
+                payloads["home_assistant"] = service_call
+        precomputed[mode_name] = payloads
+    config["_precomputed"] = precomputed
+    return config
+
+
+def precompute_request_urls(config):
+    """Build endpoint URLs once for the enabled providers; they only depend on config."""
+    urls = {}
+    hue = config["hue"]
+    if hue["enabled"]:
+        hue_base_url = f"http://{hue['bridge_ip']}/api/{hue['api_user']}"
+        # Keyed by str(light_id) throughout, matching the Hue snapshot keys.
+        light_urls = {str(light_id): f"{hue_base_url}/lights/{light_id}" for light_id in hue["lights"]}
+        light_state_urls = {light_id: f"{url}/state" for light_id, url in light_urls.items()}
+        group_id = hue.get("group_id", "")
+        if group_id:
+            # One group action lets the bridge fan out to every bulb itself.
+            hue_targets = ("group", {group_id: f"{hue_base_url}/groups/{group_id}/action"})
+        else:
+            hue_targets = ("lights", light_state_urls)
+        urls["hue_lights"] = light_urls
+        urls["hue_light_states"] = light_state_urls
+        urls["hue_targets"] = hue_targets
+    if config["home_assistant"]["enabled"]:
+        urls["home_assistant_services"] = f"{config['home_assistant']['url']}/api/services"
+    config["_urls"] = urls
+    return config
+
+
+def config_cache_key(config_path):
+    """Identify a config.json revision: cache version, file stat, and script mtime."""
+    try:
+        config_stat = config_path.stat()
+        script_mtime_ns = SCRIPT_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+    return [CONFIG_CACHE_VERSION, config_stat.st_mtime_ns, config_stat.st_size, script_mtime_ns]
+
+
+def read_config_cache(config_path, cache_key):
+    """Return the cached validated config if it matches cache_key, else None."""
+    cache_path = config_path.with_name(config_path.name + CONFIG_CACHE_SUFFIX)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != cache_key:
+        return None
+    config = cached.get("config")
+    if not isinstance(config, dict):
+        return None
+    return config
+
+
+def write_config_cache(config_path, cache_key, config):
+    """Persist a validated config next to config.json; failures are ignored."""
+    cache_path = config_path.with_name(config_path.name + CONFIG_CACHE_SUFFIX)
+    try:
+        # mkstemp creates the file 0600, matching the secrets it holds.
+        fd, tmp_path = tempfile.mkstemp(dir=str(cache_path.parent), prefix=cache_path.name + ".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": cache_key, "config": config}, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
 def load_config():
-    """Load config from config.json, falling back to env vars."""
-    config = copy.deepcopy(DEFAULT_CONFIG)
-    config_path = Path(__file__).parent / "config.json"
+    """Load config from config.json, falling back to env vars.
+
+    A validated copy of config.json is cached alongside it and reused while
+    the file (and this script) are unchanged, skipping validation on restart.
+    """
+    config = json.loads(DEFAULT_CONFIG_JSON)
+
+    # The cache key stats config.json, so a hit needs no other file access.
+    cache_key = config_cache_key(CONFIG_PATH)
+    if cache_key is not None:
+        cached = read_config_cache(CONFIG_PATH, cache_key)
+        if cached is not None:
+            return precompute_request_urls(precompute_mode_payloads(cached))
+
+    try:
+        raw_config = CONFIG_PATH.read_bytes()
+    except FileNotFoundError:
+        raw_config = None
 
-    if config_path.exists():
+    if raw_config is not None:
         try:
-            with open(config_path, encoding="utf-8") as f:
-                user_config = json.load(f)
-        except json.JSONDecodeError as exc:
+            user_config = json.loads(raw_config)
+        except ValueError as exc:
             raise ValueError(f"config.json is invalid JSON: {exc}") from exc
 
         if not isinstance(user_config, dict):
             raise ValueError("config.json must contain a JSON object at the top level")
 
-        config = deep_merge(config, user_config)
+        config = validate_config(deep_merge(config, user_config))
+        if cache_key is not None:
+            write_config_cache(CONFIG_PATH, cache_key, config)
+        return precompute_request_urls(precompute_mode_payloads(config))
     else:
         config["port"] = os.environ.get("PLEX_LIGHTS_PORT", 32500)
         config["tv_player_name"] = os.environ.get("TV_PLAYER_NAME", "")
         config["log_dir"] = os.environ.get("PLEX_LIGHTS_LOG_DIR", "")
         config["webhook_token"] = os.environ.get("PLEX_LIGHTS_WEBHOOK_TOKEN", "")
         config["dry_run"] = os.environ.get("PLEX_LIGHTS_DRY_RUN", "false")
+        config["force_apply"] = os.environ.get("PLEX_LIGHTS_FORCE_APPLY", "false")
         config["state_restore"]["enabled"] = os.environ.get("PLEX_LIGHTS_RESTORE_STATE_ENABLED", "true")
         config["state_restore"]["fallback_mode"] = os.environ.get(
             "PLEX_LIGHTS_RESTORE_FALLBACK_MODE",
@@ -432,12 +660,14 @@ def load_config():
             config["hue"]["bridge_ip"] = os.environ["HUE_BRIDGE_IP"]
             config["hue"]["api_user"] = os.environ.get("HUE_API_USER", "")
             config["hue"]["lights"] = parse_hue_lights(os.environ.get("HUE_LIGHTS", ""))
+            config["hue"]["group_id"] = os.environ.get("HUE_GROUP_ID", "")
 
         if os.environ.get("GOVEE_API_KEY"):
             config["govee"]["enabled"] = True
             config["govee"]["api_key"] = os.environ["GOVEE_API_KEY"]
             config["govee"]["device"] = os.environ.get("GOVEE_DEVICE", "")
             config["govee"]["model"] = os.environ.get("GOVEE_MODEL", "")
+            config["govee"]["brightness_in_color"] = os.environ.get("GOVEE_BRIGHTNESS_IN_COLOR", "false")
 
         if os.environ.get("HOME_ASSISTANT_URL") or os.environ.get("HOME_ASSISTANT_TOKEN"):
             config["home_assistant"]["enabled"] = True
@@ -452,91 +682,206 @@ def load_config():
                 parse_mode_scenes(os.environ.get("HOME_ASSISTANT_MODE_SCENES", "")),
             )
 
-    return validate_config(config)
+    return precompute_request_urls(precompute_mode_payloads(validate_config(config)))
 
 
 # --- Logging ---
 
 
+def raise_system_exit(signum, frame):
+    """Signal handler that unwinds the main thread like sys.exit(0)."""
+    raise SystemExit(0)
+
+
 def setup_logging(config):
+    """Configure logging so records are written by a background listener thread.
+
+    Handler threads only enqueue records; console and file I/O happen on the
+    QueueListener, off the webhook and provider paths.
+    """
     log_dir = config.get("log_dir", "")
     handlers = [logging.StreamHandler()]
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
         handlers.append(logging.FileHandler(f"{log_dir}/plex-lights.log", encoding="utf-8"))
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(message)s",
-        handlers=handlers,
-    )
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    # atexit only runs on a normal exit, and launchd stops the service with
+    # SIGTERM; exit through SystemExit so queued records are still written.
+    # Signal handlers can only be installed from the main thread.
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, raise_system_exit)
+
+    # QueueHandler renders only the message; the listener's handlers add the timestamp.
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
     return logging.getLogger("plex-lights")
 
 
-# --- Light Control ---
+# --- HTTP Session ---
+
+
+def load_requests():
+    """Import requests on first use and return the module."""
+    global requests
+    if requests is None:
+        import requests
+    return requests
+
+
+def response_excerpt(response):
+    """Decode at most ERROR_BODY_LOG_BYTES of a response body for error logs."""
+    return response.content[:ERROR_BODY_LOG_BYTES].decode("utf-8", errors="replace")
+
+
+def create_http_session(config, provider):
+    """Build the keep-alive session for one provider ("hue", "govee", or "home_assistant").
+
+    Provider credentials are set on the session once instead of on every call.
+    """
+    load_requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Retry failed connects and gateway errors briefly so a flaky network does
+    # not drop a mode change. Each connect attempt is capped at
+    # CONNECT_TIMEOUT_SECONDS, so a host that is down costs about ten seconds
+    # rather than three full request timeouts. Read timeouts are not retried:
+    # the provider may already have applied the request, and a second wait
+    # would double the delay. Govee's 429 rate-limit replies are not retried:
+    # a retry within a second would be refused again and spend more quota.
+    # Long Retry-After values are ignored so an event never stalls on them.
+    max_retries = Retry(
+        total=2,
+        connect=2,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "PUT", "POST"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    if provider == "govee":
+        session.headers["Govee-API-Key"] = config["govee"]["api_key"]
+    elif provider == "home_assistant":
+        session.headers["Authorization"] = f"Bearer {config['home_assistant']['token']}"
+
+    if provider == "hue":
+        # The bridge is a single plain-HTTP host that handles few connections at
+        # once; share a small fixed set and make extra requests wait for one.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=HUE_MAX_CONNECTIONS,
+            pool_block=True,
+            max_retries=max_retries,
+        )
+        session.mount("http://", adapter)
+        return session
+
+    for prefix in ("http://", "https://"):
+        session.mount(
+            prefix,
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=max_retries,
+            ),
+        )
+    return session
 
 
-def normalize_scene_entity_id(scene_id):
-    """Normalize scene IDs to both raw ID and entity_id format."""
-    normalized = str(scene_id or "").strip()
-    if not normalized:
-        return "", ""
-    if normalized.startswith("scene."):
-        return normalized[6:], normalized
-    return normalized, f"scene.{normalized}"
+def get_http_session(config, provider):
+    """Return the provider's shared session, creating it on first use."""
+    sessions = config.setdefault("_sessions", {})
+    session = sessions.get(provider)
+    if session is None:
+        with HTTP_SESSION_LOCK:
+            session = sessions.get(provider)
+            if session is None:
+                session = create_http_session(config, provider)
+                sessions[provider] = session
+    return session
 
 
-def parse_bool_like(value):
-    """Parse booleans from mixed payloads."""
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, int):
-        return value != 0
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        return lowered in {"on", "true", "1", "yes"}
-    return bool(value)
+def close_http_sessions(config):
+    """Close every provider session, releasing its pooled keep-alive sockets."""
+    with HTTP_SESSION_LOCK:
+        sessions = config.get("_sessions", {})
+        for session in sessions.values():
+            session.close()
+        sessions.clear()
+
+
+# --- Light Control ---
 
 
 def parse_govee_rgb(value):
-    """Normalize Govee RGB state value to dict form."""
+    """Normalize a Govee RGB state value to a packed 24-bit integer."""
     if isinstance(value, int):
-        return {
-            "r": (value >> 16) & 0xFF,
-            "g": (value >> 8) & 0xFF,
-            "b": value & 0xFF,
-        }
+        return value & 0xFFFFFF
     if isinstance(value, dict):
         try:
-            return {
-                "r": int(value.get("r", 0)),
-                "g": int(value.get("g", 0)),
-                "b": int(value.get("b", 0)),
-            }
+            r, g, b = int(value.get("r", 0)), int(value.get("g", 0)), int(value.get("b", 0))
         except (TypeError, ValueError):
             return None
+        return ((r & 0xFF) << 16) | ((g & 0xFF) << 8) | (b & 0xFF)
     return None
 
 
 def iter_capabilities(payload):
-    """Recursively find capability arrays in mixed API payloads."""
-    if isinstance(payload, dict):
-        capabilities = payload.get("capabilities")
-        if isinstance(capabilities, list):
-            yield capabilities
-        for value in payload.values():
-            yield from iter_capabilities(value)
-    elif isinstance(payload, list):
-        for item in payload:
-            yield from iter_capabilities(item)
+    """Find capability arrays in mixed API payloads, in document order.
+
+    Walks with an explicit stack instead of nested generators; children are
+    pushed in reverse so they pop in their original order.
+    """
+    found = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            capabilities = node.get("capabilities")
+            if isinstance(capabilities, list):
+                found.append(capabilities)
+            stack.extend(value for value in reversed(list(node.values())) if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(item for item in reversed(node) if isinstance(item, (dict, list)))
+    return found
+
+
+def is_hue_error(parsed):
+    """True when a parsed Hue reply reports an error.
+
+    The bridge answers with HTTP 200 and a list of per-field results, where
+    failures appear as {"error": {...}} entries.
+    """
+    return isinstance(parsed, list) and any(isinstance(entry, dict) and "error" in entry for entry in parsed)
+
+
+def hue_response_failed(response):
+    """Parse a Hue write response once and check it for error entries."""
+    try:
+        parsed = json.loads(response.content)
+    except ValueError:
+        return False
+    return is_hue_error(parsed)
 
 
 def get_hue_light_state(config, light_id, log):
     """Fetch one Hue light state for snapshot/restore."""
-    hue = config["hue"]
-    url = f"http://{hue['bridge_ip']}/api/{hue['api_user']}/lights/{light_id}"
+    url = config["_urls"]["hue_lights"][str(light_id)]
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+        response = get_http_session(config, "hue").get(url, timeout=REQUEST_TIMEOUT)
     except requests.RequestException as exc:
         log.error("Hue snapshot read failed for light %s: %s", light_id, exc)
         return None
@@ -546,17 +891,21 @@ def get_hue_light_state(config, light_id, log):
             "Hue snapshot read failed for light %s: HTTP %s %s",
             light_id,
             response.status_code,
-            response.text,
+            response_excerpt(response),
         )
         return None
 
     try:
-        data = response.json()
+        data = json.loads(response.content)
     except ValueError:
         log.error("Hue snapshot read returned invalid JSON for light %s", light_id)
         return None
 
-    state = data.get("state")
+    if is_hue_error(data):
+        log.error("Hue snapshot read API error for light %s: %s", light_id, response_excerpt(response))
+        return None
+
+    state = data.get("state") if isinstance(data, dict) else None
     if not isinstance(state, dict):
         log.error("Hue snapshot read returned invalid state for light %s", light_id)
         return None
@@ -583,11 +932,13 @@ def capture_hue_snapshot(config, log):
         log.info("[DRY RUN] Hue snapshot capture skipped")
         return {}
 
+    # Per-light reads are independent, so fetch them all at once.
+    futures = {IO_EXECUTOR.submit(get_hue_light_state, config, light_id, log): light_id for light_id in hue["lights"]}
     snapshot = {}
-    for light_id in hue["lights"]:
-        state = get_hue_light_state(config, light_id, log)
+    for future in as_completed(futures):
+        state = future.result()
         if state is not None:
-            snapshot[str(light_id)] = state
+            snapshot[str(futures[future])] = state
 
     if not snapshot:
         log.warning("Hue snapshot capture found no restorable light states")
@@ -595,6 +946,73 @@ def capture_hue_snapshot(config, log):
     return snapshot
 
 
+# Hue colormode -> (field, min, max) to restore; xy pairs are copied unclamped.
+HUE_COLORMODE_FIELDS = {
+    "ct": (("ct", 153, 500),),
+    "hs": (("hue", 0, 65535), ("sat", 0, 254)),
+    "xy": (("xy", None, None),),
+}
+
+
+def hue_color_fields(state, fields):
+    """Pick and clamp the given color fields from a Hue state, or None if any is unusable."""
+    values = {}
+    for name, low, high in fields:
+        value = state.get(name)
+        if low is None:
+            if not isinstance(value, list) or len(value) != 2:
+                return None
+            values[name] = value
+        elif isinstance(value, int):
+            values[name] = max(low, min(high, value))
+        else:
+            return None
+    return values
+
+
+def hue_restore_payload(state):
+    """Build the Hue state PUT body that puts a light back to a captured state."""
+    payload = {"on": bool(state.get("on", True))}
+    if payload["on"]:
+        bri = state.get("bri")
+        if isinstance(bri, int):
+            payload["bri"] = max(1, min(254, bri))
+
+        # Restore the light's own color mode, falling back to its color temperature.
+        fields = HUE_COLORMODE_FIELDS.get(str(state.get("colormode", "")).lower())
+        color = hue_color_fields(state, fields) if fields else None
+        if color is None:
+            color = hue_color_fields(state, HUE_COLORMODE_FIELDS["ct"])
+        if color:
+            payload.update(color)
+    return payload
+
+
+def restore_hue_light(config, light_id, payload, log):
+    """Send one Hue restore PUT; returns True when the bridge accepted it."""
+    url = config["_urls"]["hue_light_states"][str(light_id)]
+    try:
+        response = get_http_session(config, "hue").put(url, json=payload, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as exc:
+        log.error("Hue restore failed for light %s: %s", light_id, exc)
+        return False
+
+    if not response.ok:
+        log.error(
+            "Hue restore failed for light %s: HTTP %s %s",
+            light_id,
+            response.status_code,
+            response_excerpt(response),
+        )
+        return False
+
+    if hue_response_failed(response):
+        log.error("Hue restore API error for light %s: %s", light_id, response_excerpt(response))
+        return False
+
+    return True
+
+
 def restore_hue_snapshot(config, snapshot, log):
     """Restore previously captured Hue state."""
     hue = config["hue"]
@@ -605,88 +1023,74 @@ def restore_hue_snapshot(config, snapshot, log):
         log.info("[DRY RUN] Hue snapshot restore: %s lights", len(snapshot))
         return True
 
+    futures = [
+        IO_EXECUTOR.submit(restore_hue_light, config, light_id, hue_restore_payload(state), log)
+        for light_id, state in snapshot.items()
+        if isinstance(state, dict)
+    ]
     restored_any = False
-    for light_id, state in snapshot.items():
-        if not isinstance(state, dict):
-            continue
-
-        payload = {"on": bool(state.get("on", True))}
-        if payload["on"]:
-            bri = state.get("bri")
-            if isinstance(bri, int):
-                payload["bri"] = max(1, min(254, bri))
-
-            colormode = str(state.get("colormode", "")).lower()
-            if colormode == "ct" and isinstance(state.get("ct"), int):
-                payload["ct"] = max(153, min(500, state["ct"]))
-            elif colormode == "hs" and isinstance(state.get("hue"), int) and isinstance(state.get("sat"), int):
-                payload["hue"] = max(0, min(65535, state["hue"]))
-                payload["sat"] = max(0, min(254, state["sat"]))
-            elif colormode == "xy" and isinstance(state.get("xy"), list) and len(state["xy"]) == 2:
-                payload["xy"] = state["xy"]
-            elif isinstance(state.get("ct"), int):
-                payload["ct"] = max(153, min(500, state["ct"]))
-
-        url = f"http://{hue['bridge_ip']}/api/{hue['api_user']}/lights/{light_id}/state"
-        try:
-            response = requests.put(url, json=payload, timeout=REQUEST_TIMEOUT_SECONDS)
-        except requests.RequestException as exc:
-            log.error("Hue restore failed for light %s: %s", light_id, exc)
-            continue
-
-        if not response.ok:
-            log.error("Hue restore failed for light %s: HTTP %s %s", light_id, response.status_code, response.text)
-            continue
-
-        if "error" in response.text.lower():
-            log.error("Hue restore API error for light %s: %s", light_id, response.text)
-            continue
-
-        restored_any = True
-
+    for future in as_completed(futures):
+        restored_any = future.result() or restored_any
     return restored_any
 
 
 def govee_state_request(config, log):
     """Fetch current Govee device state from API."""
     govee = config["govee"]
-    headers = {
-        "Govee-API-Key": govee["api_key"],
-        "Content-Type": "application/json",
-    }
     params = {
         "sku": govee["model"],
         "device": govee["device"],
     }
 
     try:
-        response = requests.get(
-            "https://openapi.api.govee.com/router/api/v1/device/state",
-            headers=headers,
+        response = get_http_session(config, "govee").get(
+            GOVEE_STATE_URL,
             params=params,
-            timeout=REQUEST_TIMEOUT_SECONDS,
+            timeout=REQUEST_TIMEOUT,
         )
     except requests.RequestException as exc:
         log.error("Govee state request failed: %s", exc)
         return None
 
     if not response.ok:
-        log.error("Govee state request failed: HTTP %s %s", response.status_code, response.text)
+        log.error("Govee state request failed: HTTP %s %s", response.status_code, response_excerpt(response))
         return None
 
     try:
-        parsed = response.json()
+        parsed = json.loads(response.content)
     except ValueError:
         log.error("Govee state request returned invalid JSON")
         return None
 
     if isinstance(parsed, dict) and parsed.get("code") not in (None, 0, 200):
-        log.error("Govee state API error response: %s", response.text)
+        log.error("Govee state API error %s: %s", parsed.get("code"), parsed.get("msg") or response_excerpt(response))
         return None
 
     return parsed
 
 
+def parse_govee_power(value):
+    """Parse a Govee powerSwitch state value."""
+    return as_bool(value, unknown=False)
+
+
+def parse_govee_brightness(value):
+    """Parse a Govee brightness state value, or None if it is not a number."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Capability instance -> (snapshot field, value parser). Anything else is ignored.
+GOVEE_STATE_HANDLERS = {
+    "powerSwitch": ("on", parse_govee_power),
+    "brightness": ("brightness", parse_govee_brightness),
+    "colorRgb": ("color", parse_govee_rgb),
+    "color": ("color", parse_govee_rgb),
+}
+
+
 def capture_govee_snapshot(config, log):
     """Capture Govee power/brightness/color state."""
     govee = config["govee"]
@@ -706,26 +1110,23 @@ def capture_govee_snapshot(config, log):
     snapshot = {}
     for capabilities in iter_capabilities(payload):
         for capability in capabilities:
-            if not isinstance(capability, dict):
+            if type(capability) is not dict:
                 continue
-            instance = str(capability.get("instance", ""))
+            instance = capability.get("instance")
+            handler = GOVEE_STATE_HANDLERS.get(instance) if type(instance) is str else None
+            if handler is None:
+                continue
+
             state = capability.get("state", {})
             if isinstance(state, dict):
                 value = state.get("value")
             else:
                 value = capability.get("value")
 
-            if instance == "powerSwitch":
-                snapshot["on"] = parse_bool_like(value)
-            elif instance == "brightness":
-                try:
-                    snapshot["brightness"] = int(value)
-                except (TypeError, ValueError):
-                    pass
-            elif instance in {"colorRgb", "color"}:
-                rgb = parse_govee_rgb(value)
-                if rgb:
-                    snapshot["color"] = rgb
+            field, parse = handler
+            parsed = parse(value)
+            if parsed is not None:
+                snapshot[field] = parsed
 
     if not snapshot:
         log.warning("Govee snapshot capture found no restorable state values")
@@ -766,36 +1167,21 @@ def restore_govee_snapshot(config, snapshot, log):
         if not power_state:
             return restored_any
 
+    capabilities = []
     brightness = snapshot.get("brightness")
-    color = snapshot.get("color")
-    if isinstance(brightness, int) and isinstance(color, dict):
-        set_govee_light(config, max(0, min(100, brightness)), color, log)
-        return True
-
     if isinstance(brightness, int):
-        if govee_control_request(
-            config,
-            {
-                "type": "devices.capabilities.range",
-                "instance": "brightness",
-                "value": max(0, min(100, brightness)),
-            },
-            log,
-        ):
-            restored_any = True
+        capabilities.append(govee_brightness_capability(max(0, min(100, brightness))))
+    # Captured colors are already packed, so they go out exactly as Govee reported them.
+    color = snapshot.get("color")
+    if isinstance(color, int):
+        capabilities.append(govee_color_capability(color))
 
-    if isinstance(color, dict):
-        color_value = ((color["r"] & 0xFF) << 16) | ((color["g"] & 0xFF) << 8) | (color["b"] & 0xFF)
-        if govee_control_request(
-            config,
-            {
-                "type": "devices.capabilities.color_setting",
-                "instance": "colorRgb",
-                "value": color_value,
-            },
-            log,
-        ):
+    # Once the device is on, brightness and color are independent; restore them together.
+    futures = [IO_EXECUTOR.submit(govee_control_request, config, capability, log) for capability in capabilities]
+    for capability, future in zip(capabilities, futures):
+        if future.result():
             restored_any = True
+            log.info("Govee %s restored", capability["instance"])
 
     return restored_any
 
@@ -811,18 +1197,14 @@ def capture_home_assistant_snapshot(config, log):
         log.info("Home Assistant snapshot skipped: no entity_ids configured")
         return None
 
-    raw_scene_id, scene_entity_id = normalize_scene_entity_id(config["state_restore"]["home_assistant_scene_id"])
-    if not raw_scene_id:
-        log.warning("Home Assistant snapshot skipped: invalid state_restore.home_assistant_scene_id")
-        return None
-
+    state_restore = config["state_restore"]
     payload = {
-        "scene_id": raw_scene_id,
+        "scene_id": state_restore["home_assistant_scene_id"],
         "snapshot_entities": entity_ids,
     }
 
     if home_assistant_service_request(config, "scene", "create", payload, log):
-        return {"scene_entity_id": scene_entity_id}
+        return {"scene_entity_id": state_restore["_scene_entity_id"]}
     return None
 
 
@@ -832,7 +1214,7 @@ def restore_home_assistant_snapshot(config, snapshot, log):
     if not home_assistant["enabled"] or not isinstance(snapshot, dict):
         return False
 
-    scene_entity_id = str(snapshot.get("scene_entity_id", "")).strip()
+    scene_entity_id = norm_str(snapshot, "scene_entity_id")
     if not scene_entity_id:
         return False
 
@@ -849,23 +1231,26 @@ def restore_home_assistant_snapshot(config, snapshot, log):
     return False
 
 
-def capture_pre_playback_snapshot(config, log):
-    """Capture provider state at playback start."""
-    snapshot = {
-        "captured_at": int(time.time()),
+def start_pre_playback_snapshot(config, log):
+    """Start capturing provider state at playback start; returns provider -> future."""
+    capturers = {
+        "hue": capture_hue_snapshot,
+        "govee": capture_govee_snapshot,
+        "home_assistant": capture_home_assistant_snapshot,
     }
+    # Submitted ahead of the mode writes, so a capture never waits behind an apply.
+    return {provider: PROVIDER_EXECUTOR.submit(capture, config, log) for provider, capture in capturers.items()}
 
-    hue_snapshot = capture_hue_snapshot(config, log)
-    if hue_snapshot is not None:
-        snapshot["hue"] = hue_snapshot
-
-    govee_snapshot = capture_govee_snapshot(config, log)
-    if govee_snapshot is not None:
-        snapshot["govee"] = govee_snapshot
 
-    home_assistant_snapshot = capture_home_assistant_snapshot(config, log)
-    if home_assistant_snapshot is not None:
-        snapshot["home_assistant"] = home_assistant_snapshot
+def collect_pre_playback_snapshot(captured_at, capture_futures):
+    """Assemble the snapshot from start_pre_playback_snapshot futures."""
+    snapshot = {
+        "captured_at": captured_at,
+    }
+    for provider, future in capture_futures.items():
+        provider_snapshot = future.result()
+        if provider_snapshot is not None:
+            snapshot[provider] = provider_snapshot
 
     if len(snapshot) == 1:
         return None
@@ -888,9 +1273,11 @@ def apply_stop_behavior(config, log):
     """Restore pre-playback state on stop/end, with fallback mode."""
     snapshot = None
     with RUNTIME_LOCK:
-        snapshot = RUNTIME_STATE.get("snapshot")
-        RUNTIME_STATE["snapshot"] = None
-        RUNTIME_STATE["playback_active"] = False
+        snapshot = RUNTIME_STATE.snapshot
+        RUNTIME_STATE.snapshot = None
+        RUNTIME_STATE.playback_active = False
+        # Restoring a snapshot changes the lights outside apply_mode.
+        RUNTIME_STATE.applied_modes.clear()
 
     if config["state_restore"]["enabled"] and isinstance(snapshot, dict):
         if restore_pre_playback_snapshot(config, snapshot, log):
@@ -907,29 +1294,33 @@ def apply_stop_behavior(config, log):
 def apply_event_mode(config, event, mode_name, log):
     """Apply event behavior with state snapshot/restore logic."""
     if event == "play":
+        capture_futures = None
         if config["state_restore"]["enabled"]:
-            should_capture = False
             with RUNTIME_LOCK:
-                if not RUNTIME_STATE["playback_active"] and RUNTIME_STATE["snapshot"] is None:
-                    should_capture = True
+                should_capture = not RUNTIME_STATE.playback_active and RUNTIME_STATE.snapshot is None
 
             if should_capture:
-                snapshot = capture_pre_playback_snapshot(config, log)
-                with RUNTIME_LOCK:
-                    RUNTIME_STATE["snapshot"] = snapshot
-                if snapshot is not None:
-                    log.info("Captured pre-playback light snapshot")
-                else:
-                    log.warning("State restore is enabled but no provider snapshot could be captured")
+                captured_at = int(time.time())
+                capture_futures = start_pre_playback_snapshot(config, log)
 
         with RUNTIME_LOCK:
-            RUNTIME_STATE["playback_active"] = True
-        apply_mode(config, mode_name, log)
+            RUNTIME_STATE.playback_active = True
+        # Each provider's write waits only for its own capture, not the others'.
+        apply_mode(config, mode_name, log, capture_futures)
+
+        if capture_futures is not None:
+            snapshot = collect_pre_playback_snapshot(captured_at, capture_futures)
+            with RUNTIME_LOCK:
+                RUNTIME_STATE.snapshot = snapshot
+            if snapshot is not None:
+                log.info("Captured pre-playback light snapshot")
+            else:
+                log.warning("State restore is enabled but no provider snapshot could be captured")
         return
 
     if event == "resume":
         with RUNTIME_LOCK:
-            RUNTIME_STATE["playback_active"] = True
+            RUNTIME_STATE.playback_active = True
         apply_mode(config, mode_name, log)
         return
 
@@ -944,51 +1335,95 @@ def apply_event_mode(config, event, mode_name, log):
     apply_mode(config, mode_name, log)
 
 
-def set_hue_lights(config, bri, ct, log):
-    """Set all configured Hue lights to given brightness and color temp."""
+def queue_event_mode(event, mode_name):
+    """Hand an event to the apply worker, collapsing superseded mode changes.
+
+    A pending pause/resume is overwritten by whatever arrives next, so a burst
+    of scrubbing ends up as a single mode change. Play and stop are always kept
+    because they capture and restore the pre-playback snapshot.
+    """
+    with PENDING_EVENTS_CONDITION:
+        if PENDING_EVENTS and PENDING_EVENTS[-1][0] not in ("play", "stop"):
+            PENDING_EVENTS[-1] = (event, mode_name)
+        else:
+            PENDING_EVENTS.append((event, mode_name))
+        PENDING_EVENTS_CONDITION.notify()
+
+
+def run_event_worker(config, log):
+    """Apply queued events one at a time, in arrival order."""
+    while True:
+        with PENDING_EVENTS_CONDITION:
+            while not PENDING_EVENTS:
+                PENDING_EVENTS_CONDITION.wait()
+            # Hold a lone pause/resume until the burst goes quiet, since the
+            # next event would replace it anyway.
+            while len(PENDING_EVENTS) == 1 and PENDING_EVENTS[0][0] not in ("play", "stop"):
+                if not PENDING_EVENTS_CONDITION.wait(EVENT_DEBOUNCE_SECONDS):
+                    break
+            event, mode_name = PENDING_EVENTS.popleft()
+
+        try:
+            apply_event_mode(config, event, mode_name, log)
+        except Exception:
+            log.exception("Failed to apply event '%s'", event)
+
+
+def set_hue_lights(config, payload, log):
+    """Send a prebuilt Hue state payload to the configured group or lights.
+
+    Returns True when every target was updated (or Hue is disabled).
+    """
     hue = config["hue"]
     if not hue["enabled"]:
-        return
+        return True
 
-    if not hue["lights"]:
+    kind, targets = config["_urls"]["hue_targets"]
+    if not targets:
         log.warning("Hue enabled but no lights configured")
-        return
+        return False
 
     if config.get("dry_run", False):
-        for light_id in hue["lights"]:
-            log.info("[DRY RUN] Hue light %s -> on=true bri=%s ct=%s", light_id, bri, ct)
-        return
+        log.info("[DRY RUN] Hue %s %s -> on=true bri=%s ct=%s", kind, list(targets), payload["bri"], payload["ct"])
+        return True
 
-    for light_id in hue["lights"]:
-        url = f"http://{hue['bridge_ip']}/api/{hue['api_user']}/lights/{light_id}/state"
-        payload = {"on": True, "bri": bri, "ct": ct}
+    # Each target is an independent PUT to the bridge, so send them concurrently.
+    session = get_http_session(config, "hue")
+    futures = {}
+    for target_id, url in targets.items():
+        future = IO_EXECUTOR.submit(session.put, url, json=payload, timeout=REQUEST_TIMEOUT)
+        futures[future] = target_id
+
+    # Failures are logged per target; successes are summarized in one line.
+    updated = []
+    for future in as_completed(futures):
+        target_id = futures[future]
         try:
-            response = requests.put(url, json=payload, timeout=REQUEST_TIMEOUT_SECONDS)
+            response = future.result()
         except requests.RequestException as exc:
-            log.error("Hue light %s request failed: %s", light_id, exc)
+            log.error("Hue %s %s request failed: %s", kind, target_id, exc)
             continue
 
         if not response.ok:
-            log.error("Hue light %s failed: HTTP %s %s", light_id, response.status_code, response.text)
+            log.error("Hue %s %s failed: HTTP %s %s", kind, target_id, response.status_code, response_excerpt(response))
             continue
 
-        response_text = response.text.lower()
-        if "error" in response_text:
-            log.error("Hue light %s API error: %s", light_id, response.text)
+        if hue_response_failed(response):
+            log.error("Hue %s %s API error: %s", kind, target_id, response_excerpt(response))
             continue
 
-        log.info("Hue light %s updated (bri=%s, ct=%s)", light_id, bri, ct)
+        updated.append(target_id)
+
+    if updated:
+        log.info("Hue %s %s updated (bri=%s, ct=%s)", kind, sorted(updated), payload["bri"], payload["ct"])
+    return len(updated) == len(targets)
 
 
 def govee_control_request(config, capability_payload, log):
     """Send one Govee control request and validate the response."""
     govee = config["govee"]
-    headers = {
-        "Govee-API-Key": govee["api_key"],
-        "Content-Type": "application/json",
-    }
     request_body = {
-        "requestId": str(int(time.time() * 1000)),
+        "requestId": str(next(GOVEE_REQUEST_IDS)),
         "payload": {
             "sku": govee["model"],
             "device": govee["device"],
@@ -997,86 +1432,110 @@ def govee_control_request(config, capability_payload, log):
     }
 
     try:
-        response = requests.post(
-            "https://openapi.api.govee.com/router/api/v1/device/control",
-            headers=headers,
+        response = get_http_session(config, "govee").post(
+            GOVEE_CONTROL_URL,
             json=request_body,
-            timeout=REQUEST_TIMEOUT_SECONDS,
+            timeout=REQUEST_TIMEOUT,
         )
     except requests.RequestException as exc:
         log.error("Govee request failed: %s", exc)
         return False
 
     if not response.ok:
-        log.error("Govee request failed: HTTP %s %s", response.status_code, response.text)
+        log.error("Govee request failed: HTTP %s %s", response.status_code, response_excerpt(response))
         return False
 
     try:
-        parsed = response.json()
+        parsed = json.loads(response.content)
     except ValueError:
         parsed = {}
 
     if isinstance(parsed, dict) and parsed.get("code") not in (None, 0, 200):
-        log.error("Govee API error response: %s", response.text)
+        log.error("Govee API error %s: %s", parsed.get("code"), parsed.get("msg") or response_excerpt(response))
         return False
 
     return True
 
 
-def set_govee_light(config, brightness, color, log):
-    """Set Govee light brightness and color via Cloud API v1."""
+def pack_govee_color(color):
+    """Pack an r/g/b dict into the 24-bit integer Govee's colorRgb expects."""
+    return ((color["r"] & 0xFF) << 16) | ((color["g"] & 0xFF) << 8) | (color["b"] & 0xFF)
+
+
+def scale_govee_color(color_value, brightness):
+    """Scale each channel of a packed RGB value by brightness (0-100)."""
+    return (
+        ((((color_value >> 16) & 0xFF) * brightness // 100) << 16)
+        | ((((color_value >> 8) & 0xFF) * brightness // 100) << 8)
+        | ((color_value & 0xFF) * brightness // 100)
+    )
+
+
+def govee_color_capability(color_value):
+    """Build a Govee colorRgb capability payload from a packed RGB value."""
+    return {
+        "type": "devices.capabilities.color_setting",
+        "instance": "colorRgb",
+        "value": color_value,
+    }
+
+
+def govee_brightness_capability(brightness):
+    """Build a Govee brightness capability payload."""
+    return {
+        "type": "devices.capabilities.range",
+        "instance": "brightness",
+        "value": brightness,
+    }
+
+
+def set_govee_light(config, color_capability, brightness_capability, log):
+    """Send prebuilt Govee color and brightness capabilities via Cloud API v1.
+
+    brightness_capability is None when brightness is folded into the color.
+    Returns True when every request succeeded (or Govee is disabled).
+    """
     govee = config["govee"]
     if not govee["enabled"]:
-        return
+        return True
 
     if config.get("dry_run", False):
-        log.info("[DRY RUN] Govee -> brightness=%s rgb=(%s,%s,%s)", brightness, color["r"], color["g"], color["b"])
-        return
-
-    color_value = ((color["r"] & 0xFF) << 16) | ((color["g"] & 0xFF) << 8) | (color["b"] & 0xFF)
+        log.info(
+            "[DRY RUN] Govee -> brightness=%s rgb=#%06x",
+            brightness_capability["value"] if brightness_capability else "in color",
+            color_capability["value"],
+        )
+        return True
 
-    if govee_control_request(
-        config,
-        {
-            "type": "devices.capabilities.color_setting",
-            "instance": "colorRgb",
-            "value": color_value,
-        },
-        log,
-    ):
-        log.info("Govee color updated to rgb(%s, %s, %s)", color["r"], color["g"], color["b"])
+    # Color and brightness are independent capabilities; send both at once.
+    color_future = IO_EXECUTOR.submit(govee_control_request, config, color_capability, log)
+    brightness_future = None
+    if brightness_capability is not None:
+        brightness_future = IO_EXECUTOR.submit(govee_control_request, config, brightness_capability, log)
 
-    if govee_control_request(
-        config,
-        {
-            "type": "devices.capabilities.range",
-            "instance": "brightness",
-            "value": brightness,
-        },
-        log,
-    ):
-        log.info("Govee brightness updated to %s", brightness)
+    color_ok = color_future.result()
+    brightness_ok = brightness_future is None or brightness_future.result()
+    if color_ok:
+        log.info("Govee color updated to #%06x", color_capability["value"])
+    if brightness_ok and brightness_future is not None:
+        log.info("Govee brightness updated to %s", brightness_capability["value"])
+    return color_ok and brightness_ok
 
 
 def home_assistant_service_request(config, domain, service, data, log):
     """Send one Home Assistant service call."""
     home_assistant = config["home_assistant"]
-    endpoint = f"{home_assistant['url']}/api/services/{domain}/{service}"
-    headers = {
-        "Authorization": f"Bearer {home_assistant['token']}",
-        "Content-Type": "application/json",
-    }
+    endpoint = f"{config['_urls']['home_assistant_services']}/{domain}/{service}"
 
     if config.get("dry_run", False):
         log.info("[DRY RUN] Home Assistant %s.%s -> %s", domain, service, data)
         return True
 
     try:
-        response = requests.post(
+        response = get_http_session(config, "home_assistant").post(
             endpoint,
-            headers=headers,
             json=data,
-            timeout=REQUEST_TIMEOUT_SECONDS,
+            timeout=REQUEST_TIMEOUT,
             verify=home_assistant["verify_ssl"],
         )
     except requests.RequestException as exc:
@@ -1089,35 +1548,22 @@ def home_assistant_service_request(config, domain, service, data, log):
             domain,
             service,
             response.status_code,
-            response.text,
+            response_excerpt(response),
         )
         return False
 
     return True
 
 
-def set_home_assistant_mode(config, mode_name, mode, log):
-    """Apply mode via Home Assistant scene or light entities."""
-    home_assistant = config["home_assistant"]
-    if not home_assistant["enabled"]:
-        return
-
+def home_assistant_mode_service_call(home_assistant, mode_name, mode):
+    """Build the (domain, data) turn_on call for a mode, or None if nothing is configured."""
     scene_entity = home_assistant["mode_scenes"].get(mode_name, "")
     if scene_entity:
-        if home_assistant_service_request(
-            config,
-            "scene",
-            "turn_on",
-            {"entity_id": scene_entity},
-            log,
-        ):
-            log.info("Home Assistant scene applied for mode '%s': %s", mode_name, scene_entity)
-        return
+        return "scene", {"entity_id": scene_entity}
 
     entity_ids = home_assistant["entity_ids"]
     if not entity_ids:
-        log.warning("Home Assistant enabled but no entity_ids configured for mode '%s'", mode_name)
-        return
+        return None
 
     payload = {
         "entity_id": entity_ids,
@@ -1132,46 +1578,113 @@ def set_home_assistant_mode(config, mode_name, mode, log):
         payload["rgb_color"] = mode["ha_rgb_color"]
     else:
         payload["color_temp_kelvin"] = mode["ha_color_temp_kelvin"]
+    return "light", payload
+
 
-    if home_assistant_service_request(config, "light", "turn_on", payload, log):
+def set_home_assistant_mode(config, mode_name, service_call, log):
+    """Apply a prebuilt Home Assistant scene or light service call for a mode.
+
+    Returns True when the service call succeeded (or Home Assistant is disabled).
+    """
+    if not config["home_assistant"]["enabled"]:
+        return True
+
+    if service_call is None:
+        log.warning("Home Assistant enabled but no entity_ids configured for mode '%s'", mode_name)
+        return False
+
+    domain, data = service_call
+    if not home_assistant_service_request(config, domain, "turn_on", data, log):
+        return False
+
+    if domain == "scene":
+        log.info("Home Assistant scene applied for mode '%s': %s", mode_name, data["entity_id"])
+    else:
         log.info("Home Assistant lights updated for mode '%s'", mode_name)
+    return True
+
+
+def run_after(future, setter, *args):
+    """Call setter once future has finished, whatever its outcome."""
+    wait((future,))
+    return setter(*args)
+
 
+def apply_mode(config, mode_name, log, capture_futures=None):
+    """Apply a light mode to all configured lights.
 
-def apply_mode(config, mode_name, log):
-    """Apply a light mode to all configured lights."""
-    mode = config["modes"].get(mode_name)
-    if mode is None:
+    capture_futures maps a provider to its pending snapshot capture; that
+    provider's write is held until the capture finishes.
+    """
+    payloads = config["_precomputed"].get(mode_name)
+    if payloads is None:
         log.error("Unknown mode '%s'", mode_name)
         return
 
+    setters = {
+        "hue": (set_hue_lights, (config, payloads.get("hue"), log)),
+        "govee": (set_govee_light, (config, payloads.get("govee_color_cap"), payloads.get("govee_bri_cap"), log)),
+        "home_assistant": (set_home_assistant_mode, (config, mode_name, payloads.get("home_assistant"), log)),
+    }
+
+    # Duplicate events (e.g. repeated play while scrubbing) would resend the
+    # exact state the lights already hold, so only providers that are not
+    # already in this mode are sent it, unless forced.
+    if not config["force_apply"]:
+        with RUNTIME_LOCK:
+            applied = dict(RUNTIME_STATE.applied_modes)
+        setters = {provider: setter for provider, setter in setters.items() if applied.get(provider) != mode_name}
+        if not setters:
+            log.info("Mode '%s' already applied; skipping", mode_name)
+            return
+
     log.info("Applying mode: %s", mode_name)
-    set_hue_lights(config, mode["hue_brightness"], mode["hue_color_temp"], log)
-    set_govee_light(config, mode["govee_brightness"], mode["govee_color"], log)
-    set_home_assistant_mode(config, mode_name, mode, log)
+
+    # Providers are independent, so the mode change takes as long as the slowest one.
+    futures = {}
+    for provider, (setter, args) in setters.items():
+        if capture_futures and provider in capture_futures:
+            future = PROVIDER_EXECUTOR.submit(run_after, capture_futures[provider], setter, *args)
+        else:
+            future = PROVIDER_EXECUTOR.submit(setter, *args)
+        futures[future] = provider
+    # Every request has its own timeout, so this wait is bounded. Waiting for
+    # all of them keeps a slow write from landing after the next event's.
+    wait(futures)
+
+    # Remember the mode only for providers that took it, so a failed one retries.
+    with RUNTIME_LOCK:
+        for future, provider in futures.items():
+            RUNTIME_STATE.applied_modes[provider] = mode_name if future.result() else None
 
 
 # --- Webhook Handler ---
 
 
+def prebuild_response(status_code, payload):
+    """Serialize a fixed JSON response once: (status, body, Content-Length)."""
+    body = json.dumps(payload).encode("utf-8")
+    return status_code, body, str(len(body))
+
+
+# Every response the server sends is one of these, so they are encoded once.
+RESPONSES = {
+    "ok": prebuild_response(200, {"status": "ok"}),
+    "queued": prebuild_response(202, {"status": "queued"}),
+    "ignored_player": prebuild_response(200, {"status": "ignored_player"}),
+    "ignored_media_type": prebuild_response(200, {"status": "ignored_media_type"}),
+    "invalid_payload": prebuild_response(400, {"error": "invalid payload"}),
+    "invalid_token": prebuild_response(403, {"error": "invalid token"}),
+    "not_found": prebuild_response(404, {"error": "not found"}),
+    "length_required": prebuild_response(411, {"error": "length required"}),
+    "payload_too_large": prebuild_response(413, {"error": "payload too large"}),
+}
+
+
 def normalize_event(event):
     """Normalize multiple event naming styles to play/pause/resume/stop."""
-    event = event.strip().lower()
-    if event in ("play", "playback start", "playback.start", "played"):
-        return "play"
-    if event in ("resume", "playback resume", "playback.resume", "resumed"):
-        return "resume"
-    if event in ("pause", "playback pause", "playback.pause", "paused"):
-        return "pause"
-    if event in (
-        "stop",
-        "ended",
-        "playback stop",
-        "playback.stop",
-        "playback ended",
-        "stopped",
-    ):
-        return "stop"
-    return event
+    event = event.strip().casefold()
+    return EVENT_ALIASES.get(event, event)
 
 
 def extract_player_name(player_value):
@@ -1181,25 +1694,49 @@ def extract_player_name(player_value):
     return str(player_value or "").strip()
 
 
-def parse_payload(body):
-    """Parse JSON or form-encoded webhook payload."""
-    text_body = body.decode("utf-8", errors="replace")
+def parse_payload(body, content_type=""):
+    """Parse JSON or form-encoded webhook payload.
 
-    try:
-        parsed = json.loads(text_body)
+    content_type is the bare media type. Bodies sent as application/json are
+    only ever parsed as JSON. Form bodies skip the JSON attempt unless they
+    start with "{" (curl -d labels JSON as a form). A form may carry the JSON
+    in a "body" or "payload" field.
+    """
+    looks_like_json = body.lstrip().startswith(b"{")
+    if looks_like_json or content_type != "application/x-www-form-urlencoded":
+        # json.loads accepts bytes, so the JSON path skips building a decoded copy.
+        try:
+            parsed = json.loads(body)
+        except UnicodeDecodeError:
+            # A stray non-UTF-8 byte (e.g. a Latin-1 title) is replaced, not fatal.
+            try:
+                parsed = json.loads(body.decode("utf-8", errors="replace"))
+            except ValueError:
+                parsed = None
+        except ValueError:
+            parsed = None
         if isinstance(parsed, dict):
             return parsed
-    except json.JSONDecodeError:
-        pass
 
-    form_data = parse_qs(text_body)
-    if "body" in form_data and form_data["body"]:
-        try:
-            nested = json.loads(form_data["body"][0])
+    # Anything left that is not a form body (malformed JSON, plain text) has
+    # no key=value pairs, so skip the decode and parse_qs.
+    if content_type == "application/json" or looks_like_json or b"=" not in body:
+        return {}
+
+    # Only the first MAX_FORM_FIELDS fields are parsed; the rest are dropped
+    # rather than rejecting the webhook.
+    fields = body.decode("utf-8", errors="replace").split("&", MAX_FORM_FIELDS)[:MAX_FORM_FIELDS]
+    form_data = parse_qs("&".join(fields))
+
+    for field in ("body", "payload"):
+        if form_data.get(field):
+            try:
+                nested = json.loads(form_data[field][0])
+            except ValueError:
+                # Not wrapped JSON after all; fall back to the flat form fields.
+                continue
             if isinstance(nested, dict):
                 return nested
-        except json.JSONDecodeError:
-            return {}
 
     if form_data:
         return {key: values[0] for key, values in form_data.items() if values}
@@ -1207,46 +1744,97 @@ def parse_payload(body):
     return {}
 
 
+@functools.lru_cache(maxsize=32)
+def split_request_path(raw_path):
+    """Split a request target into (path, token query param).
+
+    Cached because Tautulli posts to the same webhook URL every time.
+    """
+    path, _, query = raw_path.partition("?")
+    # Only one parameter matters, so scan for it rather than building parse_qs's dict.
+    for field in query.partition("#")[0].split("&"):
+        name, _, value = field.partition("=")
+        if name == "token":
+            return path, unquote_plus(value).strip()
+    return path, ""
+
+
 def make_handler(config, log):
+    token = config.get("webhook_token", "")
+    auth_required = bool(token)
+
     class WebhookHandler(BaseHTTPRequestHandler):
-        def respond(self, status_code, payload):
-            encoded = json.dumps(payload).encode("utf-8")
+        # Applied to the client socket, so a stalled sender cannot hold a pool thread.
+        timeout = HANDLER_TIMEOUT_SECONDS
+
+        def respond(self, response_key):
+            status_code, body, content_length = RESPONSES[response_key]
             self.send_response(status_code)
             self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(encoded)))
+            self.send_header("Content-Length", content_length)
             self.end_headers()
-            self.wfile.write(encoded)
+            self.wfile.write(body)
 
         def do_GET(self):
-            path = urlparse(self.path).path
-            if path == "/health":
-                self.respond(200, {"status": "ok"})
+            if self.path == "/health" or split_request_path(self.path)[0] == "/health":
+                self.respond("ok")
                 return
-            self.respond(404, {"error": "not found"})
+            self.respond("not_found")
+
+        def read_body(self):
+            """Read the request body within MAX_BODY_BYTES.
+
+            Returns (body, None) on success or (None, response_key) when the
+            Content-Length is missing, malformed, empty, or too large.
+            """
+            content_length = self.headers.get("Content-Length")
+            if content_length is None:
+                # Without a length (e.g. chunked uploads) the body cannot be bounded up front.
+                log.warning("Rejected webhook without Content-Length")
+                return None, "length_required"
+
+            try:
+                content_length = int(content_length)
+            except ValueError:
+                log.warning("Rejected webhook with malformed Content-Length")
+                return None, "invalid_payload"
+
+            # Tautulli payloads are tiny; refuse oversized bodies without reading them.
+            if content_length > MAX_BODY_BYTES:
+                log.warning("Rejected webhook body of %s bytes (limit %s)", content_length, MAX_BODY_BYTES)
+                return None, "payload_too_large"
+
+            # Nothing to parse; skip the read entirely.
+            if content_length <= 0:
+                log.warning("Rejected webhook with empty body")
+                return None, "invalid_payload"
+
+            return self.rfile.read(content_length), None
 
         def do_POST(self):
-            token = config.get("webhook_token", "")
-            if token:
-                header_token = self.headers.get("X-Plex-Lights-Token", "").strip()
-                query_token = parse_qs(urlparse(self.path).query).get("token", [""])[0].strip()
-                if header_token != token and query_token != token:
+            if auth_required and self.headers.get(TOKEN_HEADER, "").strip() != token:
+                # Only look at the query string when the header did not match.
+                if split_request_path(self.path)[1] != token:
                     log.warning("Rejected webhook with invalid token")
-                    self.respond(403, {"error": "invalid token"})
+                    self.respond("invalid_token")
                     return
 
-            content_length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(content_length)
-            data = parse_payload(body)
+            body, error_key = self.read_body()
+            if body is None:
+                self.respond(error_key)
+                return
+
+            data = parse_payload(body, self.headers.get_content_type())
 
             if not data:
                 log.warning("Could not parse webhook body: %r", body[:200])
-                self.respond(400, {"error": "invalid payload"})
+                self.respond("invalid_payload")
                 return
 
             event = normalize_event(str(data.get("event", "")))
             player = extract_player_name(data.get("player", ""))
             if not player:
-                player = str(data.get("player_title", "")).strip()
+                player = norm_str(data, "player_title")
 
             title = str(data.get("title") or data.get("full_title") or "unknown").strip()
             media_type = str(data.get("media_type") or data.get("mediaType") or "").strip().lower()
@@ -1262,21 +1850,22 @@ def make_handler(config, log):
             tv_player = config.get("tv_player_name", "")
             if tv_player and player != tv_player:
                 log.info("Ignoring event from player '%s' (not '%s')", player, tv_player)
-                self.respond(200, {"status": "ignored_player"})
+                self.respond("ignored_player")
                 return
 
             if media_type not in SUPPORTED_MEDIA_TYPES:
                 log.info("Ignoring media type: %s", media_type)
-                self.respond(200, {"status": "ignored_media_type"})
+                self.respond("ignored_media_type")
                 return
 
             mode_name = EVENT_TO_MODE.get(event)
             if mode_name:
-                apply_event_mode(config, event, mode_name, log)
-            else:
-                log.info("Unhandled event: %s", event)
+                queue_event_mode(event, mode_name)
+                self.respond("queued")
+                return
 
-            self.respond(200, {"status": "ok"})
+            log.info("Unhandled event: %s", event)
+            self.respond("ok")
 
         def log_message(self, format, *args):
             pass
@@ -1284,6 +1873,33 @@ def make_handler(config, log):
     return WebhookHandler
 
 
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that handles connections on a fixed pool of threads.
+
+    ThreadingHTTPServer starts a new thread per connection; a bounded pool
+    reuses threads and caps concurrency during bursts of webhooks.
+    """
+
+    def __init__(self, server_address, handler_class, max_workers=HTTP_MAX_WORKERS):
+        super().__init__(server_address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plex-lights-http")
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+
+
 # --- Main ---
 
 
@@ -1305,6 +1921,10 @@ def parse_args():
 
 def main():
     args = parse_args()
+    if importlib.util.find_spec("requests") is None:
+        print("ERROR: requests not installed. Run: pip install -r requirements.txt")
+        sys.exit(1)
+
     try:
         config = load_config()
     except ValueError as exc:
@@ -1329,6 +1949,8 @@ def main():
 
     if hue_enabled:
         log.info("Hue: bridge=%s, lights=%s", config["hue"]["bridge_ip"], config["hue"]["lights"])
+        if config["hue"]["group_id"]:
+            log.info("Hue: mode changes use group %s", config["hue"]["group_id"])
     if govee_enabled:
         log.info("Govee: device=%s, model=%s", config["govee"]["device"], config["govee"]["model"])
     if home_assistant_enabled:
@@ -1364,18 +1986,27 @@ def main():
 
     handler = make_handler(config, log)
     try:
-        server = ThreadingHTTPServer(("0.0.0.0", port), handler)
+        server = PooledHTTPServer(("0.0.0.0", port), handler)
     except OSError as exc:
         log.error("Failed to bind to port %s: %s", port, exc)
         sys.exit(1)
 
-    server.daemon_threads = True
+    worker = threading.Thread(
+        target=run_event_worker,
+        args=(config, log),
+        name="plex-lights-apply",
+        daemon=True,
+    )
+    worker.start()
 
     try:
         server.serve_forever()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, SystemExit):
         log.info("Shutting down")
         server.server_close()
+        for executor in (PROVIDER_EXECUTOR, IO_EXECUTOR):
+            executor.shutdown(wait=False)
+        close_http_sessions(config)
 
 
 if __name__ == "__main__":